@@ -56,23 +56,38 @@ class SocketClientThread(threading.Thread):
 
     def run(self):
         while self.alive.isSet():
-            try:
-                # Queue.get with timeout to allow checking self.alive
-                cmd = self.cmd_q.get(True, 0.1)
-                self.handlers[cmd.type](cmd)
-            except queue.Empty as e:
+            # Block until a command arrives; join() enqueues a None
+            # sentinel so shutdown does not need a polling timeout.
+            cmd = self.cmd_q.get()
+            if cmd is None:
                 continue
+            self.handlers[cmd.type](cmd)
 
     def join(self, timeout=None):
         self.alive.clear()
+        self.cmd_q.put(None)
         threading.Thread.join(self, timeout)
 
     def _handle_CONNECT(self, cmd):
         try:
+            nodelay = cmd.data[2] if len(cmd.data) > 2 else True
+            busyPollUs = cmd.data[3] if len(cmd.data) > 3 else 0
             self.socket = socket.socket(
                 socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(5)
             self.socket.connect((cmd.data[0], cmd.data[1]))
+            if nodelay:
+                # The printer protocol is many small request/response
+                # round trips, so Nagle only adds latency.
+                self.socket.setsockopt(socket.IPPROTO_TCP,
+                                       socket.TCP_NODELAY, 1)
+            if busyPollUs and hasattr(socket, 'SO_BUSY_POLL'):
+                try:
+                    self.socket.setsockopt(socket.SOL_SOCKET,
+                                           socket.SO_BUSY_POLL, busyPollUs)
+                except OSError:
+                    # Busy polling needs elevated privileges on Linux.
+                    pass
             self.reply_q.put(self._success_reply())
         except IOError as e:
             self.reply_q.put(self._error_reply(str(e)))
@@ -108,12 +123,14 @@ class SocketClientThread(threading.Thread):
         """ Convenience method for receiving excactly n bytes from
             self.socket (assuming it's open and connected).
         """
-        data = bytearray()
-        while len(data) < n:
-            chunk = self.socket.recv(n - len(data))
-            if chunk == b'':
-                break
-            data += chunk
+        data = bytearray(n)
+        view = memoryview(data)
+        got = 0
+        while got < n:
+            received = self.socket.recv_into(view[got:])
+            if received == 0:
+                return data[:got]
+            got += received
         return data
 
     def _error_reply(self, errstr):
@@ -1,8 +1,9 @@
 """Main SP1 Interface Class."""
 
-from .comms import SocketClientThread, ClientCommand, ClientReply
+from .comms import ClientReply
+import socket
+import struct
 import time
-import queue
 import sys
 import logging
 from .exceptions import CommandTimedOutException, ConnectError
@@ -11,41 +12,68 @@ from .packet import PacketFactory, Packet, SpecificationsCommand,  \
     PrinterLockCommand, ResetCommand, PrepImageCommand, SendImageCommand, \
     Type83Command, Type195Command, LockStateCommand
 
+# The command-direction mode byte is an immutable constant used by every
+# outgoing packet; bind it once at module scope.
+_CMD_MODE = Packet.MESSAGE_MODE_COMMAND
+
 
 class SP1:
     """SP1 Client interface."""
 
     def __init__(self, ip='192.168.0.251', port=8080,
-                 timeout=10, pinCode=1111):
+                 timeout=10, pinCode=1111, nodelay=True, busyPollUs=50):
         """Initialise the client."""
         logging.debug("Initialising Instax SP-1 Class")
-        self.currentTimeMillis = int(round(time.time() * 1000))
+        self.currentTimeMillis = self._now_ms()
         self.ip = ip
         self.port = port
         self.timeout = 10
         self.pinCode = pinCode
+        self.nodelay = nodelay
+        self.busyPollUs = busyPollUs
         self.packetFactory = PacketFactory()
+        self.sock = None
+
+    @staticmethod
+    def _now_ms():
+        """Current wall-clock time in whole milliseconds."""
+        return time.time_ns() // 1000000
+
+    def _ensure_connected(self):
+        """Connect to the printer if there is no live connection."""
+        if self.sock is None:
+            self.connect()
 
     def connect(self):
-        """Connect to a printer."""
+        """Connect to a printer.
+
+        A no-op if a connection is already live, so callers can treat
+        repeated connect() calls across print phases as free.
+        """
+        if self.sock is not None:
+            return
         logging.debug("Connecting to Instax SP-1 with timeout of: %s" % self.timeout)
-        self.comms = SocketClientThread()
-        self.comms.start()
-        self.comms.cmd_q.put(ClientCommand(ClientCommand.CONNECT,
-                                           [self.ip, self.port]))
-        # Get current time
-        start = int(time.time())
-        while(int(time.time()) < (start + self.timeout)):
+        # The session time is effectively a session nonce, so refresh it
+        # for each new connection rather than reusing the init value.
+        self.currentTimeMillis = self._now_ms()
+        try:
+            self.sock = socket.create_connection((self.ip, self.port),
+                                                 self.timeout)
+        except socket.timeout:
+            raise(CommandTimedOutException())
+        except OSError as e:
+            raise(ConnectError(str(e)))
+        if self.nodelay:
+            # The printer protocol is many small request/response round
+            # trips, so Nagle only adds latency.
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.busyPollUs and hasattr(socket, 'SO_BUSY_POLL'):
             try:
-                reply = self.comms.reply_q.get(False)
-                if reply.type == ClientReply.SUCCESS:
-                    return
-                else:
-                    raise(ConnectError(reply.data))
-            except queue.Empty:
-                time.sleep(0.1)
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_BUSY_POLL,
+                                     self.busyPollUs)
+            except OSError:
+                # Busy polling needs elevated privileges on Linux.
                 pass
-        raise(CommandTimedOutException())
 
     def send_and_recieve(self, cmdBytes, timeout):
         """Send a command and waits for a response.
@@ -53,82 +81,168 @@ class SP1:
         This is a blocking call and will not check that the response is
         the correct command type for the command.
         """
-        self.comms.cmd_q.put(ClientCommand(ClientCommand.SEND, cmdBytes))
-        self.comms.cmd_q.put(ClientCommand(ClientCommand.RECEIVE))
+        self.sock.settimeout(timeout)
+        try:
+            self.sock.sendall(cmdBytes)
+            data = self._recv_frame()
+        except socket.timeout:
+            raise(CommandTimedOutException())
+        except OSError as e:
+            raise(ConnectError(str(e)))
+        return ClientReply(ClientReply.SUCCESS, data)
 
-        # Get current time
-        start = int(time.time())
-        while(int(time.time()) < (start + timeout)):
-            try:
-                reply = self.comms.reply_q.get(False)
-                if reply.data is not None:
-                    if reply.type == ClientReply.SUCCESS:
-                        return reply
-                    else:
-                        raise(ConnectError(reply.data))
-            except queue.Empty:
-                time.sleep(0.1)
-                pass
-        raise(CommandTimedOutException())
+    def _recv_frame(self):
+        """Receive a single length-prefixed packet from the socket.
+
+        The packet length from the header sizes a single buffer up
+        front, which recv_into fills in place - no intermediate bytes
+        objects or quadratic concatenation.
+        """
+        header = bytearray(4)
+        self._recv_into(header)
+        msg_len = ((header[2] & 0xFF) << 8 | (header[3] & 0xFF) << 0)
+        if msg_len < 4:
+            raise(ConnectError('Invalid packet length: %s' % msg_len))
+        payload = bytearray(msg_len)
+        payload[:4] = header
+        self._recv_into(memoryview(payload)[4:])
+        return payload
+
+    def _recv_into(self, buf):
+        """Fill buf completely from the socket."""
+        view = memoryview(buf)
+        got = 0
+        while got < len(view):
+            received = self.sock.recv_into(view[got:])
+            if received == 0:
+                raise(ConnectError('Socket Closed Prematurely'))
+            got += received
+
+    # Send Image frame: 12 byte header + 4 byte sequence number +
+    # 960 payload bytes + 2 byte checksum + CR LF.
+    SEND_IMAGE_FRAME_LEN = 980
+
+    def _encode_send_image_fast(self, sequenceNumber, payloadView, buf):
+        """Encode a Send Image command directly into a reusable buffer.
+
+        Send Image is the only packet type sent in bulk (hundreds per
+        photo), so it gets a specialised encoder that lays the frame
+        down with pack_into and sums the checksum in C, skipping the
+        generic packet machinery. The layout matches
+        Packet.generateCommand exactly.
+        """
+        struct.pack_into('>BBHIHHI', buf, 0,
+                         _CMD_MODE,
+                         Packet.MESSAGE_TYPE_SEND_IMAGE,
+                         self.SEND_IMAGE_FRAME_LEN,
+                         self.currentTimeMillis & 0xFFFFFFFF,
+                         self.pinCode, 0,
+                         sequenceNumber)
+        buf[16:976] = payloadView
+        checkSum = sum(memoryview(buf)[:976])
+        struct.pack_into('>HBB', buf, 976, (checkSum ^ -1) & 0xFFFF, 13, 10)
+        return bytes(buf)
+
+    def send_pipelined(self, cmdPackets, window=8, timeout=5, on_reply=None):
+        """Send a batch of command packets, keeping up to window in flight.
+
+        Commands are written back to back rather than waiting a full
+        round trip per command; responses are matched to commands by
+        order. Returns the decoded responses in command order.
+        """
+        sessionTime = self.currentTimeMillis
+        pinCode = self.pinCode
+        frames = [packet.encodeCommand(sessionTime, pinCode)
+                  for packet in cmdPackets]
+        return self._pipeline_encoded(frames, window=window, timeout=timeout,
+                                      on_reply=on_reply)
+
+    def _pipeline_encoded(self, frames, window=8, timeout=5, on_reply=None):
+        """Send pre-encoded command frames, reaping responses in order."""
+        responses = []
+        sent = 0
+        # Bind the per-frame lookups once; this loop runs hundreds of
+        # times when streaming an image.
+        sendall = self.sock.sendall
+        recvFrame = self._recv_frame
+        decode = self.packetFactory.decode
+        self.sock.settimeout(timeout)
+        try:
+            while len(responses) < len(frames):
+                while sent < len(frames) and (sent - len(responses)) < window:
+                    sendall(frames[sent])
+                    sent += 1
+                response = decode(recvFrame())
+                responses.append(response)
+                if on_reply is not None:
+                    on_reply(len(responses) - 1, response)
+        except socket.timeout:
+            raise(CommandTimedOutException())
+        except OSError as e:
+            raise(ConnectError(str(e)))
+        return responses
 
     def sendCommand(self, commandPacket):
         """Send a command packet and returns the response."""
+        debugEnabled = logging.getLogger().isEnabledFor(logging.DEBUG)
         encodedPacket = commandPacket.encodeCommand(self.currentTimeMillis,
                                                     self.pinCode)
-        decodedCommand = self.packetFactory.decode(encodedPacket)
-        decodedCommand.printDebug()
+        if debugEnabled:
+            decodedCommand = self.packetFactory.decode(encodedPacket)
+            decodedCommand.printDebug()
         reply = self.send_and_recieve(encodedPacket, 5)
         decodedResponse = self.packetFactory.decode(reply.data)
-        decodedResponse.printDebug()
+        if debugEnabled:
+            decodedResponse.printDebug()
         return decodedResponse
 
     def getPrinterVersion(self):
         """Get the version of the Printer hardware."""
-        cmdPacket = VersionCommand(Packet.MESSAGE_MODE_COMMAND)
+        cmdPacket = VersionCommand(_CMD_MODE)
         response = self.sendCommand(cmdPacket)
         return response
 
     def getPrinterModelName(self):
         """Get the Model Name of the Printer."""
-        cmdPacket = ModelNameCommand(Packet.MESSAGE_MODE_COMMAND)
+        cmdPacket = ModelNameCommand(_CMD_MODE)
         response = self.sendCommand(cmdPacket)
         return response
 
     def getPrintCount(self):
         """Get the historical number of prints."""
-        cmdPacket = PrintCountCommand(Packet.MESSAGE_MODE_COMMAND)
+        cmdPacket = PrintCountCommand(_CMD_MODE)
         response = self.sendCommand(cmdPacket)
         return response
 
     def getPrinterSpecifications(self):
         """Get the printer specifications."""
-        cmdPacket = SpecificationsCommand(Packet.MESSAGE_MODE_COMMAND)
+        cmdPacket = SpecificationsCommand(_CMD_MODE)
         response = self.sendCommand(cmdPacket)
         return response
 
     def sendPrePrintCommand(self, cmdNumber):
         """Send a PrePrint Command."""
-        cmdPacket = PrePrintCommand(Packet.MESSAGE_MODE_COMMAND,
+        cmdPacket = PrePrintCommand(_CMD_MODE,
                                     cmdNumber=cmdNumber)
         response = self.sendCommand(cmdPacket)
         return response
 
     def sendLockCommand(self, lockState):
         """Send a Lock State Commmand."""
-        cmdPacket = PrinterLockCommand(Packet.MESSAGE_MODE_COMMAND,
+        cmdPacket = PrinterLockCommand(_CMD_MODE,
                                        lockState=lockState)
         response = self.sendCommand(cmdPacket)
         return response
 
     def sendResetCommand(self):
         """Send a Reset Command."""
-        cmdPacket = ResetCommand(Packet.MESSAGE_MODE_COMMAND)
+        cmdPacket = ResetCommand(_CMD_MODE)
         response = self.sendCommand(cmdPacket)
         return response
 
     def sendPrepImageCommand(self, format, options, imgLength):
         """Send a Prep for Image Command."""
-        cmdPacket = PrepImageCommand(Packet.MESSAGE_MODE_COMMAND,
+        cmdPacket = PrepImageCommand(_CMD_MODE,
                                      format=format,
                                      options=options,
                                      imgLength=imgLength)
@@ -137,7 +251,7 @@ class SP1:
 
     def sendSendImageCommand(self, sequenceNumber, payloadBytes):
         """Send an Image Segment Command."""
-        cmdPacket = SendImageCommand(Packet.MESSAGE_MODE_COMMAND,
+        cmdPacket = SendImageCommand(_CMD_MODE,
                                      sequenceNumber=sequenceNumber,
                                      payloadBytes=payloadBytes)
         response = self.sendCommand(cmdPacket)
@@ -145,44 +259,37 @@ class SP1:
 
     def sendT83Command(self):
         """Send a Type 83 Command."""
-        cmdPacket = Type83Command(Packet.MESSAGE_MODE_COMMAND)
+        cmdPacket = Type83Command(_CMD_MODE)
         response = self.sendCommand(cmdPacket)
         return response
 
     def sendT195Command(self):
         """Send a Type 195 Command."""
-        cmdPacket = Type195Command(Packet.MESSAGE_MODE_COMMAND)
+        cmdPacket = Type195Command(_CMD_MODE)
         response = self.sendCommand(cmdPacket)
         return response
 
     def sendLockStateCommand(self):
         """Send a LockState Command."""
-        cmdPacket = LockStateCommand(Packet.MESSAGE_MODE_COMMAND)
+        cmdPacket = LockStateCommand(_CMD_MODE)
         response = self.sendCommand(cmdPacket)
         return response
 
     def close(self, timeout=10):
         """Close the connection to the Printer."""
         logging.debug("Closing connection to Instax SP1")
-        self.comms.cmd_q.put(ClientCommand(ClientCommand.CLOSE))
-        # Get current time
-        start = int(time.time())
-        while(int(time.time()) < (start + timeout)):
+        if self.sock is not None:
             try:
-                reply = self.comms.reply_q.get(False)
-                if reply.type == ClientReply.SUCCESS:
-                    self.comms.join()
-                    self.comms = None
-                    return
-                else:
-                    raise(ConnectError(reply.data))
-            except queue.Empty:
-                time.sleep(0.1)
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
                 pass
-        self.comms.join()
-        self.comms = None
-        raise(CommandTimedOutException())
-        
+            self.sock.close()
+            self.sock = None
+
+    def shutdown(self):
+        """Tear the client down for good, closing any live connection."""
+        self.close()
+
 
     def getPrinterInformation(self):
         """Primary function to get SP-1 information."""
@@ -205,55 +312,57 @@ class SP1:
         """Print a Photo to the Printer."""
         progressTotal = 100
         progress(0 , progressTotal, status='Connecting to instax Printer.           ')
-        # Send Pre Print Commands
+        # The whole print sequence reuses a single comms session rather
+        # than reconnecting (and sleeping) between each phase.
         self.connect()
+
+        # Send Pre Print Commands
         progress(10, progressTotal, status='Connected! - Sending Pre Print Commands.')
-        for x in range(1, 9):
-            self.sendPrePrintCommand(x)
-        self.close()
+        prePrintPackets = [PrePrintCommand(_CMD_MODE,
+                                           cmdNumber=x) for x in range(1, 9)]
+        self.send_pipelined(prePrintPackets)
 
         # Lock The Printer
-        time.sleep(1)
-        self.connect()
         progress(20, progressTotal, status='Locking Printer for Print.               ')
         self.sendLockCommand(1)
-        self.close()
 
         # Reset the Printer
-        time.sleep(1)
-        self.connect()
         progress(30, progressTotal, status='Resetting Printer.                         ')
         self.sendResetCommand()
-        self.close()
 
         # Send the Image
-        time.sleep(1)
-        self.connect()
         progress(40, progressTotal, status='About to send Image.                       ')
         self.sendPrepImageCommand(2, 0, len(imageBytes))
-        bytesToSend = len(imageBytes);
-        bytesSent = 0;
-        segment = 0;
-        while bytesToSend > 0:
-            if bytesToSend >= 960:
-                segmentBytes = imageBytes[bytesSent:bytesSent + 960]
-            else:
-                segmentBytes = imageBytes[bytesSent:bytesSent + bytesToSend]
-                segmentBytes += bytearray(960 - bytesToSend)
-            self.sendSendImageCommand(segment, bytes(segmentBytes))
-            segment += 1
-            bytesSent += 960
-            bytesToSend -= 960
-            progress(40 + 30 * bytesSent / len(imageBytes) , progressTotal, status=('Sent image segment %s.         ' % segment))
+        # Pad the image to a 960 byte multiple once, then slice it
+        # through a memoryview: every segment is full-sized, the loop is
+        # branchless, and each payload is copied exactly once - straight
+        # into the encoded frame via the specialised encoder.
+        padded = bytes(imageBytes) + b'\x00' * (-len(imageBytes) % 960)
+        mv = memoryview(padded)
+        buf = bytearray(self.SEND_IMAGE_FRAME_LEN)
+        encodeSegment = self._encode_send_image_fast
+        frames = [encodeSegment(segment, mv[offset:offset + 960], buf)
+                  for segment, offset in
+                  enumerate(range(0, len(padded), 960))]
+        totalSegments = len(frames)
+        lastPercent = -1
+
+        def onSegment(index, response):
+            # Only report progress when the integer percentage changes;
+            # formatting a status string per 960 byte segment is wasted
+            # work the callback rarely renders.
+            nonlocal lastPercent
+            percent = 40 + (30 * (index + 1)) // totalSegments
+            if percent != lastPercent:
+                lastPercent = percent
+                progress(percent, progressTotal,
+                         status=('Sent image segment %s.         '
+                                 % (index + 1)))
+        self._pipeline_encoded(frames, on_reply=onSegment)
         self.sendT83Command()
-        self.close()
         progress(70, progressTotal, status='Image Print Started.                       ')
         # Send Print State Req
-        time.sleep(1)
-        self.connect()
         self.sendLockStateCommand()
-        self.getPrinterVersion()
-        self.getPrinterModelName()
         progress(90, progressTotal, status='Checking status of print.                    ')
         printStatus = self.checkPrintStatus(30)
         if printStatus is True:
@@ -263,11 +372,17 @@ class SP1:
         self.close()
 
     def checkPrintStatus(self, timeout=30):
-        """Check the status of a print."""
-        for _ in range(timeout):
+        """Check the status of a print.
+
+        Polls the printer with an exponential backoff (50ms up to 1s)
+        so fast prints are detected quickly without hammering slow ones.
+        """
+        delay = 0.05
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
             printStateCmd = self.sendT195Command()
             if printStateCmd.header['returnCode'] is Packet.RTN_E_RCV_FRAME:
                 return True
-            else:
-                time.sleep(1)
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
         return False
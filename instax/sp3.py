@@ -32,19 +32,19 @@ class SP3:
         self.comms.start()
         self.comms.cmd_q.put(ClientCommand(ClientCommand.CONNECT,
                                            [self.ip, self.port]))
-        # Get current time
-        start = int(time.time())
-        while(int(time.time()) < (start + self.timeout)):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise(CommandTimedOutException())
             try:
-                reply = self.comms.reply_q.get(False)
-                if reply.type == ClientReply.SUCCESS:
-                    return
-                else:
-                    raise(ConnectError(reply.data))
+                reply = self.comms.reply_q.get(timeout=remaining)
             except queue.Empty:
-                time.sleep(0.1)
-                pass
-        raise(CommandTimedOutException())
+                raise(CommandTimedOutException())
+            if reply.type == ClientReply.SUCCESS:
+                return
+            else:
+                raise(ConnectError(reply.data))
 
     def send_and_recieve(self, cmdBytes, timeout):
         """Send a command and waits for a response.
@@ -55,20 +55,20 @@ class SP3:
         self.comms.cmd_q.put(ClientCommand(ClientCommand.SEND, cmdBytes))
         self.comms.cmd_q.put(ClientCommand(ClientCommand.RECEIVE))
 
-        # Get current time
-        start = int(time.time())
-        while(int(time.time()) < (start + timeout)):
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise(CommandTimedOutException())
             try:
-                reply = self.comms.reply_q.get(False)
-                if reply.data is not None:
-                    if reply.type == ClientReply.SUCCESS:
-                        return reply
-                    else:
-                        raise(ConnectError(reply.data))
+                reply = self.comms.reply_q.get(timeout=remaining)
             except queue.Empty:
-                time.sleep(0.1)
-                pass
-        raise(CommandTimedOutException())
+                raise(CommandTimedOutException())
+            if reply.data is not None:
+                if reply.type == ClientReply.SUCCESS:
+                    return reply
+                else:
+                    raise(ConnectError(reply.data))
 
     def sendCommand(self, commandPacket):
         """Send a command packet and returns the response."""
@@ -164,23 +164,25 @@ class SP3:
         """Close the connection to the Printer."""
         logging.info("Closing connection to Instax SP3")
         self.comms.cmd_q.put(ClientCommand(ClientCommand.CLOSE))
-        # Get current time
-        start = int(time.time())
-        while(int(time.time()) < (start + timeout)):
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.comms.join()
+                self.comms = None
+                raise(CommandTimedOutException())
             try:
-                reply = self.comms.reply_q.get(False)
-                if reply.type == ClientReply.SUCCESS:
-                    self.comms.join()
-                    self.comms = None
-                    return
-                else:
-                    raise(ConnectError(reply.data))
+                reply = self.comms.reply_q.get(timeout=remaining)
             except queue.Empty:
-                time.sleep(0.1)
-                pass
-        self.comms.join()
-        self.comms = None
-        raise(CommandTimedOutException())
+                self.comms.join()
+                self.comms = None
+                raise(CommandTimedOutException())
+            if reply.type == ClientReply.SUCCESS:
+                self.comms.join()
+                self.comms = None
+                return
+            else:
+                raise(ConnectError(reply.data))
         
 
     def getPrinterInformation(self):
@@ -70,18 +70,22 @@ class TestServer:
             if not data:
                 break
             buffer += data
+            # Clients may pipeline commands, so a single recv can hold
+            # several messages (or a partial one) - keep draining the
+            # buffer until only an incomplete message remains.
             while True:
+                if len(buffer) < 4:
+                    break
                 if length is None:
                     length = ((buffer[2] & 0xFF) << 8 |
                               (buffer[3] & 0xFF) << 0)
                 if len(buffer) < length:
                     break
 
-                response = self.processIncomingMessage(buffer)
+                response = self.processIncomingMessage(buffer[:length])
                 client.send(response)
-                buffer = bytearray()
+                buffer = buffer[length:]
                 length = None
-                break
         self.logger.info('Client Disconnected')
 
     def signal_handler(self, signal, frame):
@@ -3,7 +3,7 @@ Instax SP2 Test File.
 
 @jpwsutton 2016/17
 """
-from instax import PacketFactory, Packet, SpecificationsCommand,  \
+from instax import SP1, PacketFactory, Packet, SpecificationsCommand,  \
     VersionCommand, PrintCountCommand, ModelNameCommand, PrePrintCommand, \
     PrinterLockCommand, ResetCommand, PrepImageCommand, SendImageCommand, \
     Type83Command, Type195Command, LockStateCommand
@@ -472,6 +472,24 @@ class PacketTests(unittest.TestCase):
                          sequenceNumber)
         self.assertEqual(decodedPacket.payload['payloadBytes'], payloadBytes)
 
+    def test_encode_cmd_send_fast(self):
+        """Test the specialised Send Image encoder matches the generic one."""
+        sessionTime = int(round(time.time() * 1000))
+        pinCode = 1111
+        sequenceNumber = 42
+        payloadBytes = bytes([x % 256 for x in range(960)])
+        client = SP1(pinCode=pinCode)
+        client.currentTimeMillis = sessionTime
+        cmdPacket = SendImageCommand(Packet.MESSAGE_MODE_COMMAND,
+                                     sequenceNumber=sequenceNumber,
+                                     payloadBytes=payloadBytes)
+        expected = bytes(cmdPacket.encodeCommand(sessionTime, pinCode))
+        buf = bytearray(SP1.SEND_IMAGE_FRAME_LEN)
+        encoded = client._encode_send_image_fast(sequenceNumber,
+                                                 memoryview(payloadBytes),
+                                                 buf)
+        self.assertEqual(encoded, expected)
+
     def test_encode_resp_send(self):
         """Test encoding a Send Image Response."""
         sessionTime = int(round(time.time() * 1000))